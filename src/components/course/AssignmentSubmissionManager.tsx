@@ -19,10 +19,7 @@ import { format } from 'date-fns';
 import { supabase } from '@/integrations/supabase/client';
 import { useAuth } from '@/hooks/useAuth';
 import { toast } from 'sonner';
-
-// Las calificaciones ahora se almacenan como letras en la base de datos
-const VALID_GRADES = ['AD', 'A', 'B', 'C'] as const;
-type Grade = typeof VALID_GRADES[number];
+import { GRADE_OPTIONS, isLetterGrade } from '@/utils/gradeUtils';
 
 interface AssignmentSubmission {
   id: string;
@@ -148,6 +145,11 @@ export function AssignmentSubmissionManager({
       return;
     }
 
+    if (!isLetterGrade(values.score)) {
+      toast.error('Calificación no válida');
+      return;
+    }
+
     try {
       const { error } = await supabase
         .from('assignment_submissions')
@@ -307,10 +309,9 @@ export function AssignmentSubmissionManager({
                              <SelectValue placeholder="Selecciona una calificación" />
                            </SelectTrigger>
                            <SelectContent>
-                             <SelectItem value="AD">AD - Logro Destacado</SelectItem>
-                             <SelectItem value="A">A - Logro Esperado</SelectItem>
-                             <SelectItem value="B">B - En Proceso</SelectItem>
-                             <SelectItem value="C">C - En Inicio</SelectItem>
+                             {GRADE_OPTIONS.map((option) => (
+                               <SelectItem key={option.value} value={option.value}>{option.label}</SelectItem>
+                             ))}
                            </SelectContent>
                          </Select>
                        </div>
@@ -39,36 +39,26 @@ export function CourseAssignmentsReview({ courseId }: CourseAssignmentsReviewPro
     try {
       setLoading(true);
 
-      // Fetch assignments for this course
+      // Fetch assignments for this course with submission and graded counts
+      // aggregated in the same query instead of two count requests per assignment
       const { data: assignmentsData, error: assignmentsError } = await supabase
         .from('assignments')
-        .select('id, title, description, due_date, max_score, created_at')
+        .select(`
+          id, title, description, due_date, max_score, created_at,
+          submissions:assignment_submissions(count),
+          graded:assignment_submissions(count)
+        `)
         .eq('course_id', courseId)
+        .not('graded.score', 'is', null)
         .order('created_at', { ascending: false });
 
       if (assignmentsError) throw assignmentsError;
 
-      // For each assignment, get submission counts
-      const assignmentsWithCounts = await Promise.all(
-        (assignmentsData || []).map(async (assignment) => {
-          const { count: totalCount } = await supabase
-            .from('assignment_submissions')
-            .select('*', { count: 'exact', head: true })
-            .eq('assignment_id', assignment.id);
-
-          const { count: gradedCount } = await supabase
-            .from('assignment_submissions')
-            .select('*', { count: 'exact', head: true })
-            .eq('assignment_id', assignment.id)
-            .not('score', 'is', null);
-
-          return {
-            ...assignment,
-            submissions_count: totalCount || 0,
-            graded_count: gradedCount || 0
-          };
-        })
-      );
+      const assignmentsWithCounts = (assignmentsData || []).map(({ submissions, graded, ...assignment }) => ({
+        ...assignment,
+        submissions_count: submissions?.[0]?.count || 0,
+        graded_count: graded?.[0]?.count || 0
+      }));
 
       setAssignments(assignmentsWithCounts);
     } catch (error) {
@@ -17,6 +17,7 @@ import { supabase } from '@/integrations/supabase/client';
 import { SidebarTrigger } from "@/components/ui/sidebar"
 import { useAuth } from "@/hooks/useAuth"
 import { useToast } from "@/hooks/use-toast"
+import { getRoleLabel } from "@/utils/roleNavigation"
 
 export function Header() {
   const { profile, signOut, activeRole } = useAuth();
@@ -84,17 +85,6 @@ export function Header() {
     return `${firstName.charAt(0)}${lastName.charAt(0)}`.toUpperCase();
   };
 
-  const getRoleLabel = (role: string) => {
-    switch (role) {
-      case 'admin': return 'Administrador';
-      case 'teacher': return 'Docente';
-      case 'student': return 'Estudiante';
-      case 'parent': return 'Padre de Familia';
-      case 'tutor': return 'Tutor';
-      default: return 'Usuario';
-    }
-  };
-
   return (
     <header className="border-b border-border/50 bg-gradient-card/80 backdrop-blur-sm">
       <div className="flex h-16 items-center px-6 gap-4">
@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react';
-import { useAuth, UserRole } from '@/hooks/useAuth';
+import { useAuth, UserRole, invalidateProfileCache } from '@/hooks/useAuth';
+import { ROLE_LABELS, getRoleLabel } from '@/utils/roleNavigation';
 import { supabase } from '@/integrations/supabase/client';
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
@@ -9,13 +10,9 @@ import { toast } from 'sonner';
 import { Plus, Trash2, CheckCircle } from 'lucide-react';
 import { Label } from '@/components/ui/label';
 
-const AVAILABLE_ROLES: { value: UserRole; label: string }[] = [
-  { value: 'student', label: 'Estudiante' },
-  { value: 'teacher', label: 'Docente' },
-  { value: 'tutor', label: 'Tutor' },
-  { value: 'parent', label: 'Padre de Familia' },
-  { value: 'admin', label: 'Administrador' }
-];
+const AVAILABLE_ROLES: { value: UserRole; label: string }[] = (Object.keys(ROLE_LABELS) as UserRole[]).map(
+  (role) => ({ value: role, label: ROLE_LABELS[role] })
+);
 
 export function UserRolesManager() {
   const { profile, user, activeRole, setActiveRole } = useAuth();
@@ -30,6 +27,18 @@ export function UserRolesManager() {
     }
   }, [profile]);
 
+  // Roles in the session come from the access token claim, so re-issue the
+  // token after editing user_roles; onAuthStateChange then reloads the profile
+  const refreshRolesClaim = async () => {
+    if (!user) return;
+
+    invalidateProfileCache(user.id);
+    const { error } = await supabase.auth.refreshSession();
+    if (error) {
+      console.error('Error refreshing session:', error);
+    }
+  };
+
   const fetchUserRoles = async () => {
     if (!user) return;
 
@@ -77,6 +86,7 @@ export function UserRolesManager() {
 
       toast.success('Rol agregado correctamente');
       setSelectedRole('');
+      await refreshRolesClaim();
       await fetchUserRoles();
     } catch (error: any) {
       console.error('Error adding role:', error);
@@ -111,6 +121,7 @@ export function UserRolesManager() {
       if (error) throw error;
 
       toast.success('Rol eliminado correctamente');
+      await refreshRolesClaim();
       
       // If deleted role was active, switch to primary role
       if (activeRole === roleToRemove) {
@@ -127,10 +138,6 @@ export function UserRolesManager() {
     }
   };
 
-  const getRoleLabel = (role: UserRole) => {
-    return AVAILABLE_ROLES.find(r => r.value === role)?.label || role;
-  };
-
   const availableRolesToAdd = AVAILABLE_ROLES.filter(
     r => !userRoles.includes(r.value)
   );
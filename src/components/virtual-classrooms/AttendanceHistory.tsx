@@ -17,6 +17,7 @@ interface Student {
   id: string;
   first_name: string;
   last_name: string;
+  full_name?: string | null;
   email: string;
 }
 
@@ -30,8 +31,7 @@ interface AttendanceRecord {
   recorded_by: string | null;
   student?: Student;
   recorder?: {
-    first_name: string;
-    last_name: string;
+    full_name: string | null;
   };
 }
 
@@ -135,16 +135,22 @@ export function AttendanceHistory({ classroomId }: AttendanceHistoryProps) {
       let query = supabase
         .from('attendance')
         .select(`
-          *,
+          id,
+          student_id,
+          date,
+          status,
+          notes,
+          recorded_at,
+          recorded_by,
           student:profiles!attendance_student_id_fkey(
             id,
             first_name,
             last_name,
+            full_name,
             email
           ),
           recorder:profiles!attendance_recorded_by_fkey(
-            first_name,
-            last_name
+            full_name
           )
         `)
         .eq('classroom_id', classroomId)
@@ -227,11 +233,11 @@ export function AttendanceHistory({ classroomId }: AttendanceHistoryProps) {
     const rows = attendanceRecords.map(record => [
       format(new Date(record.date), 'dd/MM/yyyy'),
       record.recorded_at ? format(new Date(record.recorded_at), 'HH:mm:ss') : '-',
-      `${record.student?.first_name} ${record.student?.last_name}`,
+      record.student?.full_name || '',
       record.student?.email || '',
       getStatusLabel(record.status),
       record.notes || '',
-      record.recorder ? `${record.recorder.first_name} ${record.recorder.last_name}` : '-'
+      record.recorder?.full_name || '-'
     ]);
 
     const csvContent = [
@@ -529,7 +535,7 @@ export function AttendanceHistory({ classroomId }: AttendanceHistoryProps) {
                         {dateRecords[0]?.recorded_at && (
                           <p className="text-xs text-muted-foreground">
                             Registrado a las {format(new Date(dateRecords[0].recorded_at), 'HH:mm:ss')}
-                            {dateRecords[0].recorder && ` por ${dateRecords[0].recorder.first_name} ${dateRecords[0].recorder.last_name}`}
+                            {dateRecords[0].recorder?.full_name && ` por ${dateRecords[0].recorder.full_name}`}
                           </p>
                         )}
                       </div>
@@ -48,50 +48,52 @@ export function ClassroomCoursesList({ classroomId, classroomName }: ClassroomCo
   const fetchCourses = async () => {
     try {
       setLoading(true);
-      const { data: coursesData, error } = await supabase
+      // Embed teacher, the student's own enrollment and the section count so the
+      // whole list comes back in a single request instead of one per course
+      let coursesQuery = supabase
         .from('courses')
         .select(`
           *,
-          profiles!courses_teacher_id_fkey(first_name, last_name)
+          profiles!courses_teacher_id_fkey(first_name, last_name),
+          course_enrollments(id),
+          course_weekly_sections(count)
         `)
         .eq('classroom_id', classroomId)
         .eq('is_active', true)
         .order('code');
 
+      if (profile?.id) {
+        coursesQuery = coursesQuery.eq('course_enrollments.student_id', profile.id);
+      }
+
+      const { data: coursesData, error } = await coursesQuery;
+
       if (error) throw error;
 
-      // Check enrollment status for each course
-      const coursesWithEnrollment = await Promise.all(
-        (coursesData || []).map(async (course) => {
-          const { data: enrollment } = await supabase
-            .from('course_enrollments')
-            .select('id')
-            .eq('course_id', course.id)
-            .eq('student_id', profile?.id)
-            .maybeSingle();
+      // student_progress has no foreign key to courses, fetch it in one batch
+      const courseIds = (coursesData || []).map(course => course.id);
+      const completedByCourse = new Map<string, number>();
 
-          // Get progress data
-          const { data: sectionsData } = await supabase
-            .from('course_weekly_sections')
-            .select('id')
-            .eq('course_id', course.id);
+      if (profile?.id && courseIds.length > 0) {
+        const { data: progressData } = await supabase
+          .from('student_progress')
+          .select('course_id')
+          .in('course_id', courseIds)
+          .eq('student_id', profile.id)
+          .eq('progress_type', 'section_completed');
 
-          const { data: progressData } = await supabase
-            .from('student_progress')
-            .select('id')
-            .eq('course_id', course.id)
-            .eq('student_id', profile?.id)
-            .eq('progress_type', 'section_completed');
+        (progressData || []).forEach(progress => {
+          completedByCourse.set(progress.course_id, (completedByCourse.get(progress.course_id) || 0) + 1);
+        });
+      }
 
-          return {
-            ...course,
-            teacher: course.profiles || { first_name: 'Profesor', last_name: 'Asignado' },
-            is_enrolled: !!enrollment,
-            total_sections: sectionsData?.length || 0,
-            completed_sections: progressData?.length || 0
-          };
-        })
-      );
+      const coursesWithEnrollment = (coursesData || []).map(({ course_enrollments, course_weekly_sections, ...course }) => ({
+        ...course,
+        teacher: course.profiles || { first_name: 'Profesor', last_name: 'Asignado' },
+        is_enrolled: profile?.id ? (course_enrollments?.length || 0) > 0 : false,
+        total_sections: course_weekly_sections?.[0]?.count || 0,
+        completed_sections: completedByCourse.get(course.id) || 0
+      }));
 
       setCourses(coursesWithEnrollment);
     } catch (error) {
@@ -32,6 +32,87 @@ interface AuthContextType {
 
 const AuthContext = createContext<AuthContextType | undefined>(undefined);
 
+// Profiles are cached per user for a short time so repeated auth events
+// (initial session, token refresh, tab focus) don't hit the database again
+const PROFILE_CACHE_TTL_MS = 30_000;
+const profileCache = new Map<string, { profile: Profile; expiresAt: number }>();
+const pendingProfiles = new Map<string, Promise<Profile | null>>();
+
+// Roles embedded in the access token by the custom_access_token_hook
+function rolesFromAccessToken(accessToken?: string): UserRole[] | null {
+  if (!accessToken) return null;
+  try {
+    const payload = accessToken.split('.')[1].replace(/-/g, '+').replace(/_/g, '/');
+    const claims = JSON.parse(atob(payload));
+    return Array.isArray(claims.user_roles) ? claims.user_roles as UserRole[] : null;
+  } catch {
+    return null;
+  }
+}
+
+async function loadProfile(userId: string, accessToken?: string): Promise<Profile | null> {
+  const cached = profileCache.get(userId);
+  if (cached && cached.expiresAt > Date.now()) {
+    return cached.profile;
+  }
+
+  // Share the in-flight request when getSession and onAuthStateChange race
+  const pending = pendingProfiles.get(userId);
+  if (pending) return pending;
+
+  const request = (async () => {
+    // Prefer the roles claim; query user_roles only if the hook is not enabled,
+    // and in that case alongside the profile since neither depends on the other
+    const tokenRoles = rolesFromAccessToken(accessToken);
+    const [{ data: profileData }, rolesResult] = await Promise.all([
+      // Only the columns the Profile context exposes
+      supabase
+        .from('profiles')
+        .select('id, user_id, email, first_name, last_name, role, phone, avatar_url, is_active')
+        .eq('user_id', userId)
+        .single(),
+      tokenRoles
+        ? null
+        : supabase
+            .from('user_roles')
+            .select('role')
+            .eq('user_id', userId),
+    ]);
+
+    if (!profileData) return null;
+
+    const userRoles = tokenRoles
+      ?? rolesResult?.data?.map(r => r.role as UserRole)
+      ?? [];
+
+    // Get all roles or use profile role as fallback
+    const allRoles = userRoles.length > 0
+      ? userRoles
+      : [profileData.role as UserRole];
+
+    // Use the first role as the primary role
+    const profile = {
+      ...profileData,
+      role: allRoles[0],
+      roles: allRoles
+    } as Profile;
+
+    profileCache.set(userId, { profile, expiresAt: Date.now() + PROFILE_CACHE_TTL_MS });
+    return profile;
+  })();
+
+  pendingProfiles.set(userId, request);
+  try {
+    return await request;
+  } finally {
+    pendingProfiles.delete(userId);
+  }
+}
+
+export function invalidateProfileCache(userId: string) {
+  profileCache.delete(userId);
+}
+
 export function AuthProvider({ children }: { children: ReactNode }) {
   const [user, setUser] = useState<User | null>(null);
   const [profile, setProfile] = useState<Profile | null>(null);
@@ -49,41 +130,17 @@ export function AuthProvider({ children }: { children: ReactNode }) {
         if (session?.user) {
           // Fetch user profile
           setTimeout(async () => {
-            const { data: profileData } = await supabase
-              .from('profiles')
-              .select('*')
-              .eq('user_id', session.user.id)
-              .single();
+            const profile = await loadProfile(session.user.id, session.access_token);
             
-            if (profileData) {
-              // Fetch user roles from user_roles table
-              const { data: rolesData } = await supabase
-                .from('user_roles')
-                .select('role')
-                .eq('user_id', session.user.id);
-
-              // Get all roles or use profile role as fallback
-              const allRoles = rolesData && rolesData.length > 0 
-                ? rolesData.map(r => r.role as UserRole)
-                : [profileData.role as UserRole];
-
-              // Use the first role as the primary role
-              const primaryRole = allRoles[0];
-
-              const profile = {
-                ...profileData,
-                role: primaryRole,
-                roles: allRoles
-              };
-              
+            if (profile) {
               setProfile(profile);
 
               // Load active role from localStorage or use primary role
               const savedActiveRole = localStorage.getItem('activeRole') as UserRole;
-              if (savedActiveRole && allRoles.includes(savedActiveRole)) {
+              if (savedActiveRole && profile.roles.includes(savedActiveRole)) {
                 setActiveRoleState(savedActiveRole);
               } else {
-                setActiveRoleState(primaryRole);
+                setActiveRoleState(profile.role);
               }
             
               // Fetch unread notifications for students
@@ -123,41 +180,17 @@ export function AuthProvider({ children }: { children: ReactNode }) {
       if (session?.user) {
         // Fetch user profile
         setTimeout(async () => {
-          const { data: profileData } = await supabase
-            .from('profiles')
-            .select('*')
-            .eq('user_id', session.user.id)
-            .single();
+          const profile = await loadProfile(session.user.id, session.access_token);
           
-          if (profileData) {
-            // Fetch user roles from user_roles table
-            const { data: rolesData } = await supabase
-              .from('user_roles')
-              .select('role')
-              .eq('user_id', session.user.id);
-
-            // Get all roles or use profile role as fallback
-            const allRoles = rolesData && rolesData.length > 0 
-              ? rolesData.map(r => r.role as UserRole)
-              : [profileData.role as UserRole];
-
-            // Use the first role as the primary role
-            const primaryRole = allRoles[0];
-
-            const profile = {
-              ...profileData,
-              role: primaryRole,
-              roles: allRoles
-            };
-            
+          if (profile) {
             setProfile(profile);
 
             // Load active role from localStorage or use primary role
             const savedActiveRole = localStorage.getItem('activeRole') as UserRole;
-            if (savedActiveRole && allRoles.includes(savedActiveRole)) {
+            if (savedActiveRole && profile.roles.includes(savedActiveRole)) {
               setActiveRoleState(savedActiveRole);
             } else {
-              setActiveRoleState(primaryRole);
+              setActiveRoleState(profile.role);
             }
           }
           
@@ -192,6 +225,7 @@ export function AuthProvider({ children }: { children: ReactNode }) {
   };
 
   const signOut = async () => {
+    if (user) invalidateProfileCache(user.id);
     await supabase.auth.signOut();
     localStorage.removeItem('activeRole');
   };
@@ -53,6 +53,32 @@ export type Database = {
         }
         Relationships: []
       }
+      announcement_roles: {
+        Row: {
+          announcement_id: string
+          id: string
+          role: Database["public"]["Enums"]["user_role"]
+        }
+        Insert: {
+          announcement_id: string
+          id?: string
+          role: Database["public"]["Enums"]["user_role"]
+        }
+        Update: {
+          announcement_id?: string
+          id?: string
+          role?: Database["public"]["Enums"]["user_role"]
+        }
+        Relationships: [
+          {
+            foreignKeyName: "announcement_roles_announcement_id_fkey"
+            columns: ["announcement_id"]
+            isOneToOne: false
+            referencedRelation: "announcements"
+            referencedColumns: ["id"]
+          },
+        ]
+      }
       announcements: {
         Row: {
           author_id: string
@@ -988,6 +1014,7 @@ export type Database = {
           document_type: string | null
           email: string
           first_name: string
+          full_name: string | null
           gender: string | null
           id: string
           is_active: boolean | null
@@ -1008,6 +1035,7 @@ export type Database = {
           document_type?: string | null
           email: string
           first_name: string
+          full_name?: never
           gender?: string | null
           id?: string
           is_active?: boolean | null
@@ -1028,6 +1056,7 @@ export type Database = {
           document_type?: string | null
           email?: string
           first_name?: string
+          full_name?: never
           gender?: string | null
           id?: string
           is_active?: boolean | null
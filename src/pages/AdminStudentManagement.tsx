@@ -110,7 +110,7 @@ const AdminStudentManagement = () => {
       const { data, error } = await supabase
         .from('profiles')
         .select(`
-          *,
+          id, first_name, last_name, email, phone, role, is_active, created_at,
           enrollments:course_enrollments (count)
         `)
         .eq('role', 'student')
@@ -302,15 +302,17 @@ const AdminStudentManagement = () => {
     if (!selectedStudent || !selectedCourseForEnrollment) return;
 
     try {
-      // Check if already enrolled
-      const { data: existingEnrollment } = await supabase
+      // Single INSERT ... ON CONFLICT DO NOTHING; no row back means already enrolled
+      const { data: newEnrollment, error } = await supabase
         .from('course_enrollments')
-        .select('id')
-        .eq('student_id', selectedStudent.id)
-        .eq('course_id', selectedCourseForEnrollment)
-        .single();
+        .upsert([{
+          student_id: selectedStudent.id,
+          course_id: selectedCourseForEnrollment,
+          enrolled_at: new Date().toISOString()
+        }], { onConflict: 'course_id,student_id', ignoreDuplicates: true })
+        .select('id');
 
-      if (existingEnrollment) {
+      if (!error && newEnrollment?.length === 0) {
         toast({
           title: "Error",
           description: "El estudiante ya está inscrito en este curso",
@@ -319,14 +321,6 @@ const AdminStudentManagement = () => {
         return;
       }
 
-      const { error } = await supabase
-        .from('course_enrollments')
-        .insert([{
-          student_id: selectedStudent.id,
-          course_id: selectedCourseForEnrollment,
-          enrolled_at: new Date().toISOString()
-        }]);
-
       if (error) {
         console.error('Error enrolling student:', error);
         toast({
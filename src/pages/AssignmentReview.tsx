@@ -44,10 +44,7 @@ import { toast } from 'sonner';
 import { EditAssignmentDialog } from '@/components/assignments/EditAssignmentDialog';
 import { FileUpload } from '@/components/ui/file-upload';
 import PdfAnnotator from '@/components/assignments/PdfAnnotator';
-
-// Las calificaciones ahora se almacenan como letras en la base de datos
-const VALID_GRADES = ['AD', 'A', 'B', 'C'] as const;
-type Grade = typeof VALID_GRADES[number];
+import { GRADE_OPTIONS, isLetterGrade } from '@/utils/gradeUtils';
 
 interface Assignment {
   id: string;
@@ -291,6 +288,11 @@ const AssignmentReview = () => {
       return;
     }
 
+    if (!isLetterGrade(score)) {
+      toast.error('Calificación no válida');
+      return;
+    }
+
     // Validate file sizes
     const maxSize = 5 * 1024 * 1024; // 5MB
     const oversizedFiles = feedbackFiles.filter((file) => file.size > maxSize);
@@ -672,10 +674,9 @@ const AssignmentReview = () => {
                           <SelectValue placeholder="Selecciona una calificación" />
                         </SelectTrigger>
                         <SelectContent>
-                          <SelectItem value="AD">AD - Logro Destacado</SelectItem>
-                          <SelectItem value="A">A - Logro Esperado</SelectItem>
-                          <SelectItem value="B">B - En Proceso</SelectItem>
-                          <SelectItem value="C">C - En Inicio</SelectItem>
+                          {GRADE_OPTIONS.map((option) => (
+                            <SelectItem key={option.value} value={option.value}>{option.label}</SelectItem>
+                          ))}
                         </SelectContent>
                       </Select>
                     </div>
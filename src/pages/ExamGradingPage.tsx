@@ -14,10 +14,7 @@ import { CheckCircle, XCircle, Clock, Save, ArrowLeft, User, Calendar as Calenda
 import { toast } from 'sonner';
 import { format } from 'date-fns';
 import { es } from 'date-fns/locale';
-
-// Las calificaciones ahora se almacenan como letras en la base de datos
-const VALID_GRADES = ['AD', 'A', 'B', 'C'] as const;
-type Grade = typeof VALID_GRADES[number];
+import { GRADE_OPTIONS } from '@/utils/gradeUtils';
 
 interface Question {
   id: string;
@@ -370,10 +367,9 @@ const ExamGradingPage = () => {
                             <SelectValue placeholder="Selecciona una calificación" />
                           </SelectTrigger>
                           <SelectContent>
-                            <SelectItem value="AD">AD - Logro Destacado</SelectItem>
-                            <SelectItem value="A">A - Logro Esperado</SelectItem>
-                            <SelectItem value="B">B - En Proceso</SelectItem>
-                            <SelectItem value="C">C - En Inicio</SelectItem>
+                            {GRADE_OPTIONS.map((option) => (
+                              <SelectItem key={option.value} value={option.value}>{option.label}</SelectItem>
+                            ))}
                           </SelectContent>
                         </Select>
                        </div>
@@ -37,64 +37,50 @@ const Index = () => {
     try {
       setLoadingStats(true);
 
-      // Get courses count
-      const { count: coursesCount } = await supabase
-        .from('course_enrollments')
-        .select('*', { count: 'exact', head: true })
-        .eq('student_id', profile!.id);
-
-      // Get pending assignments
-      const { data: enrollments } = await supabase
-        .from('course_enrollments')
-        .select('course_id')
-        .eq('student_id', profile!.id);
+      // Enrollments and attendance don't depend on each other, fetch them together
+      const [{ data: enrollments }, { data: attendance }] = await Promise.all([
+        supabase
+          .from('course_enrollments')
+          .select('course_id')
+          .eq('student_id', profile!.id),
+        supabase
+          .from('attendance')
+          .select('status')
+          .eq('student_id', profile!.id),
+      ]);
 
       const courseIds = enrollments?.map(e => e.course_id) || [];
+      const coursesCount = courseIds.length;
 
       let pendingAssignments = 0;
-      if (courseIds.length > 0) {
-        // Get all assignments in enrolled courses
-        const { data: assignments } = await supabase
-          .from('assignments')
-          .select('id')
-          .in('course_id', courseIds)
-          .eq('is_published', true)
-          .gt('due_date', new Date().toISOString());
-
-        const assignmentIds = assignments?.map(a => a.id) || [];
-
-        if (assignmentIds.length > 0) {
-          // Get submitted assignments
-          const { data: submissions } = await supabase
-            .from('assignment_submissions')
-            .select('assignment_id')
-            .eq('student_id', profile!.id)
-            .in('assignment_id', assignmentIds);
-
-          const submittedIds = new Set(submissions?.map(s => s.assignment_id) || []);
-          pendingAssignments = assignmentIds.filter(id => !submittedIds.has(id)).length;
-        }
-      }
-
-      // Get upcoming exams
       let upcomingExams = 0;
       if (courseIds.length > 0) {
-        const { count: examsCount } = await supabase
-          .from('exams')
-          .select('*', { count: 'exact', head: true })
-          .in('course_id', courseIds)
-          .eq('is_published', true)
-          .gt('start_time', new Date().toISOString());
-
+        const now = new Date().toISOString();
+
+        // Count open assignments without a submission from this student and
+        // upcoming exams in enrolled courses; only the counts cross the wire
+        const [{ count: pendingCount }, { count: examsCount }] = await Promise.all([
+          supabase
+            .from('assignments')
+            .select('id, assignment_submissions(id)', { count: 'exact', head: true })
+            .in('course_id', courseIds)
+            .eq('is_published', true)
+            .gt('due_date', now)
+            .eq('assignment_submissions.student_id', profile!.id)
+            .is('assignment_submissions', null),
+          supabase
+            .from('exams')
+            .select('*', { count: 'exact', head: true })
+            .in('course_id', courseIds)
+            .eq('is_published', true)
+            .gt('start_time', now),
+        ]);
+
+        pendingAssignments = pendingCount || 0;
         upcomingExams = examsCount || 0;
       }
 
       // Get attendance rate
-      const { data: attendance } = await supabase
-        .from('attendance')
-        .select('status')
-        .eq('student_id', profile!.id);
-
       let attendanceRate = 0;
       if (attendance && attendance.length > 0) {
         const presentCount = attendance.filter(a => 
@@ -104,7 +90,7 @@ const Index = () => {
       }
 
       setStats({
-        coursesCount: coursesCount || 0,
+        coursesCount,
         pendingAssignments,
         upcomingExams,
         attendanceRate,
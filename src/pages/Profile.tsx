@@ -13,8 +13,9 @@ import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
 import { Form, FormControl, FormField, FormItem, FormLabel, FormMessage } from "@/components/ui/form";
 import { Textarea } from "@/components/ui/textarea";
 import { DashboardLayout } from "@/components/layout/DashboardLayout";
-import { useAuth } from "@/hooks/useAuth";
+import { useAuth, invalidateProfileCache } from "@/hooks/useAuth";
 import { useToast } from "@/hooks/use-toast";
+import { getRoleLabel } from "@/utils/roleNavigation";
 import { supabase } from "@/integrations/supabase/client";
 import { User, Camera, Mail, Phone, Calendar, Shield, ClipboardCheck } from "lucide-react";
 import { StudentAttendance } from "@/components/profile/StudentAttendance";
@@ -62,6 +63,8 @@ export default function Profile() {
 
       if (error) throw error;
 
+      invalidateProfileCache(profile.user_id);
+
       toast({
         title: "Perfil actualizado",
         description: "Tu información ha sido actualizada correctamente.",
@@ -81,17 +84,6 @@ export default function Profile() {
     return `${firstName.charAt(0)}${lastName.charAt(0)}`.toUpperCase();
   };
 
-  const getRoleLabel = (role: string) => {
-    switch (role) {
-      case 'admin': return 'Administrador';
-      case 'teacher': return 'Docente';
-      case 'student': return 'Estudiante';
-      case 'parent': return 'Padre de Familia';
-      case 'tutor': return 'Tutor';
-      default: return 'Usuario';
-    }
-  };
-
   const getRoleColor = (role: string) => {
     switch (role) {
       case 'admin': return 'bg-destructive text-destructive-foreground';
@@ -79,7 +79,7 @@ const SimpleCourseManagement = () => {
         .from('courses')
         .select(`
           *,
-          teacher:profiles(id, first_name, last_name, email)
+          teacher:profiles!courses_teacher_id_fkey(id, first_name, last_name, email)
         `)
         .order('created_at', { ascending: false });
 
@@ -17,21 +17,7 @@ import { format } from 'date-fns';
 import { es } from 'date-fns/locale';
 import { Progress } from '@/components/ui/progress';
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '@/components/ui/table';
-
-// Convert letter grades to numeric scores
-const convertLetterGrade = (score: string): number => {
-  const numericScore = Number(score);
-  if (!isNaN(numericScore)) return numericScore;
-  
-  const letterGrades: { [key: string]: number } = {
-    'AD': 18,
-    'A': 15,
-    'B': 12,
-    'C': 9
-  };
-  
-  return letterGrades[score.toUpperCase()] || 0;
-};
+import { convertLetterGrade } from '@/utils/gradeUtils';
 
 interface Student {
   id: string;
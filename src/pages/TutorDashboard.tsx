@@ -20,22 +20,7 @@ import { Dialog, DialogContent, DialogDescription, DialogHeader, DialogTitle } f
 import { format, startOfMonth, endOfMonth } from 'date-fns';
 import { es } from 'date-fns/locale';
 import { Progress } from '@/components/ui/progress';
-
-// Convert letter grades to numeric scores
-const convertLetterGrade = (score: string): number => {
-  const numericScore = Number(score);
-  if (!isNaN(numericScore)) return numericScore;
-  
-  // Letter grade conversion
-  const letterGrades: { [key: string]: number } = {
-    'AD': 18,
-    'A': 15,
-    'B': 12,
-    'C': 9
-  };
-  
-  return letterGrades[score.toUpperCase()] || 0;
-};
+import { convertLetterGrade } from '@/utils/gradeUtils';
 
 interface VirtualClassroom {
   id: string;
@@ -341,7 +326,8 @@ export default function TutorDashboard() {
           });
         });
 
-        // Track course grades per student
+        // Track score totals and course grades per student in a single pass
+        const studentScoreTotals = new Map<string, number>();
         const studentCourseGrades = new Map<string, Map<string, { total: number; count: number; course_name: string; course_code: string }>>();
 
         allSubmissions.forEach(sub => {
@@ -354,6 +340,8 @@ export default function TutorDashboard() {
           else if (score >= 11) current.b_count++;
           else current.c_count++;
 
+          studentScoreTotals.set(sub.student_id, (studentScoreTotals.get(sub.student_id) || 0) + score);
+
           // Track by course
           if (!studentCourseGrades.has(sub.student_id)) {
             studentCourseGrades.set(sub.student_id, new Map());
@@ -377,9 +365,7 @@ export default function TutorDashboard() {
 
         gradeMap.forEach((record, studentId) => {
           if (record.total_graded > 0) {
-            const studentSubmissions = allSubmissions.filter(s => s.student_id === record.student_id);
-            const sum = studentSubmissions.reduce((acc, s) => acc + convertLetterGrade(s.score), 0);
-            record.average_score = sum / record.total_graded;
+            record.average_score = (studentScoreTotals.get(record.student_id) || 0) / record.total_graded;
 
             // Add course breakdown
             const courseGradesMap = studentCourseGrades.get(record.student_id);
@@ -402,8 +388,9 @@ export default function TutorDashboard() {
         console.log('📊 === RESUMEN DE CALIFICACIONES ===');
         console.log('✅ Total estudiantes con datos:', finalGradeData.length);
         console.log('📋 Detalle de calificaciones por estudiante:');
+        const studentsById = new Map(uniqueStudents.map(s => [s.id, s]));
         finalGradeData.forEach(grade => {
-          const student = uniqueStudents.find(s => s.id === grade.student_id);
+          const student = studentsById.get(grade.student_id);
           console.log(`  👤 ${student?.first_name} ${student?.paternal_surname}:`, {
             total_calificadas: grade.total_graded,
             promedio: grade.average_score.toFixed(2),
@@ -502,6 +489,10 @@ export default function TutorDashboard() {
     );
   }
 
+  // Index per-student records once instead of scanning the arrays for every student
+  const attendanceByStudent = new Map(attendanceData.map(a => [a.student_id, a]));
+  const gradesByStudent = new Map(gradeData.map(g => [g.student_id, g]));
+
   const overallAttendanceRate = attendanceData.length > 0
     ? attendanceData.reduce((acc, r) => acc + r.attendance_rate, 0) / attendanceData.length
     : 0;
@@ -513,8 +504,8 @@ export default function TutorDashboard() {
   // Calculate students at risk
   const studentsAtRisk = students
     .map(student => {
-      const attendance = attendanceData.find(a => a.student_id === student.id);
-      const grades = gradeData.find(g => g.student_id === student.id);
+      const attendance = attendanceByStudent.get(student.id);
+      const grades = gradesByStudent.get(student.id);
       
       const attendanceRate = attendance?.attendance_rate || 0;
       const averageScore = grades?.average_score || 0;
@@ -551,8 +542,8 @@ export default function TutorDashboard() {
   });
 
   const studentsWithGoodPerformance = students.filter(student => {
-    const attendance = attendanceData.find(a => a.student_id === student.id);
-    const grades = gradeData.find(g => g.student_id === student.id);
+    const attendance = attendanceByStudent.get(student.id);
+    const grades = gradesByStudent.get(student.id);
     return (attendance?.attendance_rate || 0) >= 90 && (grades?.average_score || 0) >= 14;
   }).length;
 
@@ -726,7 +717,7 @@ export default function TutorDashboard() {
                     </div>
                   )}
                   {filteredStudents.map(student => {
-                    const grades = gradeData.find(g => g.student_id === student.id);
+                    const grades = gradesByStudent.get(student.id);
                     if (!grades || grades.total_graded === 0) {
                       return (
                         <div key={student.id} className="flex items-center justify-between p-4 border rounded-lg gap-4">
@@ -878,7 +869,7 @@ export default function TutorDashboard() {
                     </div>
                   )}
                   {filteredStudents.map(student => {
-                    const attendance = attendanceData.find(a => a.student_id === student.id);
+                    const attendance = attendanceByStudent.get(student.id);
                     if (!attendance || attendance.total === 0) {
                       return (
                         <div key={student.id} className="flex items-center justify-between p-4 border rounded-lg gap-4">
@@ -0,0 +1,37 @@
+// Numeric equivalent of each letter grade, built once at module load
+const LETTER_GRADES: Record<string, number> = {
+  'AD': 18,  // Logro Destacado
+  'A': 15,   // Logro Esperado
+  'B': 12,   // En Proceso
+  'C': 9     // En Inicio
+};
+
+// Letter grades stored in assignment_submissions.score
+export const VALID_GRADES = ['AD', 'A', 'B', 'C'] as const;
+export type Grade = typeof VALID_GRADES[number];
+
+// Options offered when grading, shared by every grading form
+export const GRADE_OPTIONS: { value: Grade; label: string }[] = [
+  { value: 'AD', label: 'AD - Logro Destacado' },
+  { value: 'A', label: 'A - Logro Esperado' },
+  { value: 'B', label: 'B - En Proceso' },
+  { value: 'C', label: 'C - En Inicio' }
+];
+
+/**
+ * Checks that a score is one of the letter grades before it is saved
+ */
+export function isLetterGrade(score: string): score is Grade {
+  return (VALID_GRADES as readonly string[]).includes(score);
+}
+
+/**
+ * Converts a stored score to a number. Numeric strings are returned as-is,
+ * letter grades (AD, A, B, C) map to their equivalent and anything else is 0
+ */
+export function convertLetterGrade(score: string): number {
+  const numericScore = Number(score);
+  if (!isNaN(numericScore)) return numericScore;
+
+  return LETTER_GRADES[score.toUpperCase()] || 0;
+}
@@ -17,6 +17,20 @@ import {
 
 export type UserRole = 'admin' | 'teacher' | 'student' | 'parent' | 'tutor';
 
+// Display name of each role, looked up directly instead of scanning a list
+// Key order is the order roles are offered in the role selector
+export const ROLE_LABELS: Record<UserRole, string> = {
+  student: 'Estudiante',
+  teacher: 'Docente',
+  tutor: 'Tutor',
+  parent: 'Padre de Familia',
+  admin: 'Administrador'
+};
+
+export function getRoleLabel(role: string): string {
+  return ROLE_LABELS[role as UserRole] ?? 'Usuario';
+}
+
 export interface NavItem {
   title: string;
   url: string;
@@ -6,6 +6,13 @@ const corsHeaders = {
   'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
 }
 
+// Service-role client, reused across requests
+const supabaseClient = createClient(
+  Deno.env.get("SUPABASE_URL") ?? '',
+  Deno.env.get("SUPABASE_SERVICE_ROLE_KEY") ?? '',
+  { auth: { persistSession: false, autoRefreshToken: false } }
+)
+
 serve(async (req: Request) => {
   // Handle CORS preflight requests
   if (req.method === 'OPTIONS') {
@@ -23,12 +30,6 @@ serve(async (req: Request) => {
   }
 
   try {
-    // Get the Supabase client
-    const supabaseClient = createClient(
-      Deno.env.get("SUPABASE_URL") ?? '',
-      Deno.env.get("SUPABASE_SERVICE_ROLE_KEY") ?? ''
-    )
-
     // Get user from Authorization header
     const authHeader = req.headers.get('Authorization')
     if (!authHeader) {
@@ -110,7 +111,7 @@ serve(async (req: Request) => {
       )
     }
 
-    console.log('🔍 Datos recibidos:', JSON.stringify(body, null, 2))
+    console.log('🔍 Datos recibidos:', JSON.stringify(body))
     console.log(`➕ Creando curso: ${name} (${code})`)
 
     // Verify that the classroom exists and user has access
@@ -224,7 +225,7 @@ serve(async (req: Request) => {
       is_active: true
     }
 
-    console.log('💾 Insertando curso con datos:', JSON.stringify(courseData, null, 2))
+    console.log('💾 Insertando curso con datos:', JSON.stringify(courseData))
     const { data: newCourse, error: courseError } = await supabaseClient
       .from('courses')
       .insert([courseData])
@@ -5,6 +5,30 @@ const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
   'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
 }
+
+// Service-role client, reused across requests
+const supabase = createClient(
+  Deno.env.get("SUPABASE_URL") ?? '',
+  Deno.env.get("SUPABASE_SERVICE_ROLE_KEY") ?? '',
+  { auth: { persistSession: false, autoRefreshToken: false } }
+)
+
+// JSON responses at least this large are gzipped when the client accepts it
+const MIN_COMPRESS_BYTES = 500
+
+function jsonResponse(req: Request, payload: unknown, status = 200): Response {
+  const body = new TextEncoder().encode(JSON.stringify(payload))
+  const headers = { ...corsHeaders, 'Content-Type': 'application/json', 'Vary': 'Accept-Encoding' }
+
+  const acceptsGzip = req.headers.get('Accept-Encoding')?.includes('gzip')
+  if (!acceptsGzip || body.length < MIN_COMPRESS_BYTES) {
+    return new Response(body, { headers, status })
+  }
+
+  const compressed = new Blob([body]).stream().pipeThrough(new CompressionStream('gzip'))
+  return new Response(compressed, { headers: { ...headers, 'Content-Encoding': 'gzip' }, status })
+}
+
 serve(async (req: Request) => {
   // Handle CORS preflight requests
   if (req.method === 'OPTIONS') {
@@ -21,12 +45,6 @@ serve(async (req: Request) => {
   }
 
   try {
-    // Get the Supabase client
-    const supabase = createClient(
-      Deno.env.get("SUPABASE_URL") ?? '',
-      Deno.env.get("SUPABASE_SERVICE_ROLE_KEY") ?? ''
-    )
-
     // Handle GET requests - Obtener estudiantes
     if (req.method === 'GET') {
       console.log('🔍 Obteniendo estudiantes...')
@@ -50,14 +68,11 @@ serve(async (req: Request) => {
       }
 
       console.log(`✅ Estudiantes obtenidos: ${data?.length || 0}`)
-      return new Response(
-        JSON.stringify({
-          success: true,
-          data: data || [],
-          count: data?.length || 0
-        }),
-        { headers: { ...corsHeaders, 'Content-Type': 'application/json' }, status: 200 }
-      )
+      return jsonResponse(req, {
+        success: true,
+        data: data || [],
+        count: data?.length || 0
+      })
     }
 
     // Handle POST requests - Crear estudiante(s) y asociarlo a aulas virtuales
@@ -87,6 +102,83 @@ serve(async (req: Request) => {
           errors: []
         };
 
+        // Precargar perfiles existentes por DNI y código en lotes, en vez de 2 consultas por estudiante.
+        // Cada clave guarda todos los perfiles que la comparten (por id), como en la base de datos
+        const profilesByDNI = new Map<string, Map<string, any>>();
+        const profilesByCode = new Map<string, Map<string, any>>();
+
+        const indexProfile = (index: Map<string, Map<string, any>>, key: string | null | undefined, profile: any) => {
+          if (!key) return;
+          let entry = index.get(key);
+          if (!entry) {
+            entry = new Map();
+            index.set(key, entry);
+          }
+          entry.set(profile.id, profile);
+        };
+
+        const unindexProfile = (index: Map<string, Map<string, any>>, key: string | null | undefined, profileId: string) => {
+          if (!key) return;
+          index.get(key)?.delete(profileId);
+        };
+
+        // Igual que .single(): si dos perfiles comparten la clave no hay coincidencia y se pasa a la siguiente búsqueda
+        const findUniqueProfile = (index: Map<string, Map<string, any>>, key: string | null | undefined) => {
+          const entry = key ? index.get(key) : undefined;
+          return entry && entry.size === 1 ? entry.values().next().value : null;
+        };
+
+        const documentNumbers = [...new Set(students.map((s: any) => s.document_number).filter(Boolean))] as string[];
+        const studentCodes = [...new Set(students.map((s: any) => s.student_code).filter(Boolean))] as string[];
+        const LOOKUP_BATCH_SIZE = 200;
+
+        for (let i = 0; i < documentNumbers.length; i += LOOKUP_BATCH_SIZE) {
+          const { data: profiles, error: lookupError } = await supabase
+            .from('profiles')
+            .select('id, user_id, email, student_code, document_number')
+            .in('document_number', documentNumbers.slice(i, i + LOOKUP_BATCH_SIZE))
+            .eq('role', 'student');
+
+          // Sin la precarga, los estudiantes existentes se tratarían como nuevos y se duplicarían
+          if (lookupError) {
+            console.error('❌ Error buscando perfiles existentes por DNI:', lookupError);
+            return new Response(
+              JSON.stringify({
+                success: false,
+                error: 'Error al buscar estudiantes existentes, importación cancelada',
+                details: lookupError.message
+              }),
+              { headers: { ...corsHeaders, 'Content-Type': 'application/json' }, status: 500 }
+            );
+          }
+
+          profiles?.forEach(p => indexProfile(profilesByDNI, p.document_number, p));
+        }
+
+        for (let i = 0; i < studentCodes.length; i += LOOKUP_BATCH_SIZE) {
+          const { data: profiles, error: lookupError } = await supabase
+            .from('profiles')
+            .select('id, user_id, email, student_code, document_number')
+            .in('student_code', studentCodes.slice(i, i + LOOKUP_BATCH_SIZE))
+            .eq('role', 'student');
+
+          if (lookupError) {
+            console.error('❌ Error buscando perfiles existentes por código:', lookupError);
+            return new Response(
+              JSON.stringify({
+                success: false,
+                error: 'Error al buscar estudiantes existentes, importación cancelada',
+                details: lookupError.message
+              }),
+              { headers: { ...corsHeaders, 'Content-Type': 'application/json' }, status: 500 }
+            );
+          }
+
+          profiles?.forEach(p => indexProfile(profilesByCode, p.student_code, p));
+        }
+
+        console.log(`🔍 Perfiles existentes: ${profilesByDNI.size} por DNI, ${profilesByCode.size} por código`);
+
         for (const studentData of students) {
           try {
             const email = `${studentData.student_code}@estudiante.edu.pe`;
@@ -99,12 +191,7 @@ serve(async (req: Request) => {
             
             // Buscar por DNI primero
             if (studentData.document_number) {
-              const { data: profileByDNI } = await supabase
-                .from('profiles')
-                .select('id, user_id, email, student_code')
-                .eq('document_number', studentData.document_number)
-                .eq('role', 'student')
-                .single();
+              const profileByDNI = findUniqueProfile(profilesByDNI, studentData.document_number);
               
               if (profileByDNI) {
                 existingProfile = profileByDNI;
@@ -114,12 +201,7 @@ serve(async (req: Request) => {
             
             // Si no se encontró por DNI, buscar por student_code
             if (!existingProfile && studentData.student_code) {
-              const { data: profileByCode } = await supabase
-                .from('profiles')
-                .select('id, user_id, email, student_code')
-                .eq('student_code', studentData.student_code)
-                .eq('role', 'student')
-                .single();
+              const profileByCode = findUniqueProfile(profilesByCode, studentData.student_code);
               
               if (profileByCode) {
                 existingProfile = profileByCode;
@@ -128,6 +210,8 @@ serve(async (req: Request) => {
             }
 
             let profileId: string;
+            // Perfil tal como estaba antes de esta fila, para actualizar los índices de DNI y código
+            let previousProfile: any = existingProfile;
 
             if (existingProfile) {
               console.log(`✏️ Estudiante existe, actualizando: ${studentData.student_code}`);
@@ -181,12 +265,13 @@ serve(async (req: Request) => {
                   
                   const { data: profileByEmail } = await supabase
                     .from('profiles')
-                    .select('id')
+                    .select('id, role, student_code, document_number')
                     .eq('email', email)
                     .single();
                   
                   if (profileByEmail) {
                     profileId = profileByEmail.id;
+                    previousProfile = profileByEmail;
                     
                     // Actualizar el profile con los datos del Excel
                     const { error: updateError } = await supabase
@@ -235,10 +320,8 @@ serve(async (req: Request) => {
                 // Usuario creado exitosamente
                 console.log(`✅ Usuario auth creado: ${email}, user_id: ${authData.user.id}`);
                 
-                // Paso 3: Esperar un momento para que el trigger cree el profile básico
-                await new Promise(resolve => setTimeout(resolve, 500));
-                
-                // Buscar el profile creado por el trigger
+                // Paso 3: Buscar el profile creado por el trigger
+                // (handle_new_user corre en la misma transacción que createUser, no hace falta esperar)
                 const { data: triggeredProfile } = await supabase
                   .from('profiles')
                   .select('id')
@@ -289,38 +372,48 @@ serve(async (req: Request) => {
               }
             }
 
-            // Inscribir en cursos (evitando duplicados)
+            // Reflejar la actualización en los índices para filas posteriores del mismo archivo:
+            // quitar el DNI y código anteriores del perfil y registrar los nuevos
+            if (previousProfile) {
+              unindexProfile(profilesByDNI, previousProfile.document_number, profileId);
+              unindexProfile(profilesByCode, previousProfile.student_code, profileId);
+            }
+            // Las búsquedas originales solo consideraban perfiles con rol student
+            if (!previousProfile || !previousProfile.role || previousProfile.role === 'student') {
+              const importedProfile = { id: profileId, student_code: studentData.student_code, document_number: studentData.document_number };
+              indexProfile(profilesByDNI, studentData.document_number, importedProfile);
+              indexProfile(profilesByCode, studentData.student_code, importedProfile);
+            }
+
+            // Inscribir en cursos (evitando duplicados) con un solo INSERT multi-fila
             let enrollmentCount = 0;
             if (courseIds.length > 0) {
               console.log(`📚 Inscribiendo en ${courseIds.length} cursos...`);
-              
-              for (const courseId of courseIds) {
-                // Verificar si ya está inscrito
-                const { data: existingEnrollment } = await supabase
-                  .from('course_enrollments')
-                  .select('id')
-                  .eq('student_id', profileId)
-                  .eq('course_id', courseId)
-                  .single();
-
-                if (!existingEnrollment) {
-                  const { error: enrollError } = await supabase
-                    .from('course_enrollments')
-                    .insert({
-                      student_id: profileId,
-                      course_id: courseId,
-                    });
 
-                  if (enrollError) {
-                    console.error(`⚠️ Error inscribiendo en curso ${courseId}:`, enrollError);
-                  } else {
-                    enrollmentCount++;
-                    console.log(`✅ Inscrito en curso ${courseId}`);
-                  }
-                } else {
-                  console.log(`ℹ️ Ya inscrito en curso ${courseId}`);
-                }
+              const { data: newEnrollments, error: enrollError } = await supabase
+                .from('course_enrollments')
+                .upsert(
+                  courseIds.map((courseId: string) => ({
+                    student_id: profileId,
+                    course_id: courseId,
+                  })),
+                  { onConflict: 'course_id,student_id', ignoreDuplicates: true }
+                )
+                .select('id');
+
+              if (enrollError) {
+                // El INSERT multi-fila es atómico: un curso inválido deja al estudiante sin ninguna inscripción
+                console.error(`❌ Error inscribiendo en cursos: ${studentData.student_code}`, enrollError);
+                results.errors.push({ 
+                  student_code: studentData.student_code, 
+                  error: `Perfil guardado, pero no se pudo inscribir en los cursos: ${enrollError.message}` 
+                });
+                continue;
               }
+
+              // ON CONFLICT DO NOTHING solo devuelve las filas nuevas
+              enrollmentCount = newEnrollments?.length || 0;
+              console.log(`✅ Inscrito en ${enrollmentCount} cursos nuevos (${courseIds.length - enrollmentCount} ya inscritos)`);
             }
 
             const message = existingProfile 
@@ -6,6 +6,13 @@ const corsHeaders = {
   'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
 }
 
+// Service-role client, reused across requests
+const supabaseClient = createClient(
+  Deno.env.get("SUPABASE_URL") ?? '',
+  Deno.env.get("SUPABASE_SERVICE_ROLE_KEY") ?? '',
+  { auth: { persistSession: false, autoRefreshToken: false } }
+)
+
 serve(async (req: Request) => {
   // Handle CORS preflight requests
   if (req.method === 'OPTIONS') {
@@ -13,12 +20,6 @@ serve(async (req: Request) => {
   }
 
   try {
-    // Get the Supabase client
-    const supabaseClient = createClient(
-      Deno.env.get("SUPABASE_URL") ?? '',
-      Deno.env.get("SUPABASE_SERVICE_ROLE_KEY") ?? ''
-    )
-
     console.log('🔍 STEP 1: Supabase client created')
 
     // Get user from Authorization header
@@ -88,7 +89,7 @@ serve(async (req: Request) => {
       // NO dates at all to test
     }
 
-    console.log('🔍 STEP 6: About to insert minimal course data:', JSON.stringify(minimalCourseData, null, 2))
+    console.log('🔍 STEP 6: About to insert minimal course data:', JSON.stringify(minimalCourseData))
 
     const { data: newCourse, error: courseError } = await supabaseClient
       .from('courses')
@@ -6,6 +6,13 @@ const corsHeaders = {
   'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
 }
 
+// Service-role client, reused across requests
+const supabase = createClient(
+  Deno.env.get("SUPABASE_URL") ?? '',
+  Deno.env.get("SUPABASE_SERVICE_ROLE_KEY") ?? '',
+  { auth: { persistSession: false, autoRefreshToken: false } }
+)
+
 serve(async (req: Request) => {
     // Handle CORS preflight requests
     if (req.method === 'OPTIONS') {
@@ -24,12 +31,6 @@ serve(async (req: Request) => {
     }
    
     try {
-        // Get the Supabase client
-        const supabase = createClient(
-            Deno.env.get("SUPABASE_URL") ?? '',
-            Deno.env.get("SUPABASE_SERVICE_ROLE_KEY") ?? ''
-        )
-
         // Handle GET requests - Obtener todos los cursos
         if (req.method === 'GET') {
             console.log('🔍 Obteniendo cursos...')
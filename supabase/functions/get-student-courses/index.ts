@@ -6,6 +6,29 @@ const corsHeaders = {
   'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
 }
 
+// Service-role client, reused across requests
+const supabaseClient = createClient(
+  Deno.env.get("SUPABASE_URL") ?? '',
+  Deno.env.get("SUPABASE_SERVICE_ROLE_KEY") ?? '',
+  { auth: { persistSession: false, autoRefreshToken: false } }
+)
+
+// JSON responses at least this large are gzipped when the client accepts it
+const MIN_COMPRESS_BYTES = 500
+
+function jsonResponse(req: Request, payload: unknown, status = 200): Response {
+  const body = new TextEncoder().encode(JSON.stringify(payload))
+  const headers = { ...corsHeaders, 'Content-Type': 'application/json', 'Vary': 'Accept-Encoding' }
+
+  const acceptsGzip = req.headers.get('Accept-Encoding')?.includes('gzip')
+  if (!acceptsGzip || body.length < MIN_COMPRESS_BYTES) {
+    return new Response(body, { headers, status })
+  }
+
+  const compressed = new Blob([body]).stream().pipeThrough(new CompressionStream('gzip'))
+  return new Response(compressed, { headers: { ...headers, 'Content-Encoding': 'gzip' }, status })
+}
+
 serve(async (req: Request) => {
   // Handle CORS preflight requests
   if (req.method === 'OPTIONS') {
@@ -23,12 +46,6 @@ serve(async (req: Request) => {
   }
 
   try {
-    // Get the Supabase client
-    const supabaseClient = createClient(
-      Deno.env.get("SUPABASE_URL") ?? '',
-      Deno.env.get("SUPABASE_SERVICE_ROLE_KEY") ?? ''
-    )
-
     // Get user from Authorization header
     const authHeader = req.headers.get('Authorization')
     if (!authHeader) {
@@ -183,17 +200,21 @@ serve(async (req: Request) => {
         ...(additionalCourses?.map(ct => ct.course).filter(Boolean) || [])
       ]
 
-      // Remove duplicates based on course id
-      const uniqueCourses = allCourses.reduce((acc, course) => {
-        if (!acc.find(c => c.id === course.id)) {
-          acc.push(course)
+      // Remove duplicates based on course id, keeping the first occurrence
+      const coursesById = new Map<string, any>()
+      for (const course of allCourses) {
+        if (!coursesById.has(course.id)) {
+          coursesById.set(course.id, course)
         }
-        return acc
-      }, [] as any[])
+      }
 
-      // Sort by created_at
-      coursesData = uniqueCourses.sort((a, b) => 
-        new Date(b.created_at).getTime() - new Date(a.created_at).getTime()
+      // Sort by created_at, parsing each timestamp once instead of per comparison
+      const createdAtById = new Map<string, number>()
+      for (const course of coursesById.values()) {
+        createdAtById.set(course.id, Date.parse(course.created_at))
+      }
+      coursesData = [...coursesById.values()].sort((a, b) =>
+        createdAtById.get(b.id)! - createdAtById.get(a.id)!
       )
 
     } else if (profile.role === 'admin') {
@@ -244,16 +265,13 @@ serve(async (req: Request) => {
 
     console.log(`✅ Cursos obtenidos para ${profile.role}: ${coursesData.length}`)
 
-    return new Response(
-      JSON.stringify({
-        success: true,
-        data: coursesData,
-        count: coursesData.length,
-        user_role: profile.role,
-        message: `Cursos obtenidos exitosamente para ${profile.role}`
-      }),
-      { headers: { ...corsHeaders, 'Content-Type': 'application/json' }, status: 200 }
-    )
+    return jsonResponse(req, {
+      success: true,
+      data: coursesData,
+      count: coursesData.length,
+      user_role: profile.role,
+      message: `Cursos obtenidos exitosamente para ${profile.role}`
+    })
 
   } catch (error) {
     console.error('💥 Error general en get-student-courses:', error)
@@ -0,0 +1,32 @@
+-- Create function to generate time-ordered UUIDv7 values
+-- Layout: 48-bit unix timestamp in milliseconds, version 7, variant 10, random bits.
+-- Built on top of gen_random_uuid() so no extension is required; the v4 value
+-- already carries the RFC 4122 variant and its version nibble is turned into 7.
+CREATE OR REPLACE FUNCTION public.gen_uuid_v7()
+RETURNS UUID AS $$
+  SELECT encode(
+    set_bit(
+      set_bit(
+        overlay(
+          uuid_send(gen_random_uuid())
+          PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+          FROM 1 FOR 6
+        ),
+        52, 1
+      ),
+      53, 1
+    ),
+    'hex'
+  )::uuid;
+$$ LANGUAGE SQL VOLATILE SET search_path = public;
+
+-- Use UUIDv7 as primary key default so new rows append to the right-most
+-- B-tree leaf instead of landing on random index pages.
+-- Column types stay UUID, existing v4 keys remain valid.
+ALTER TABLE public.profiles ALTER COLUMN id SET DEFAULT public.gen_uuid_v7();
+ALTER TABLE public.courses ALTER COLUMN id SET DEFAULT public.gen_uuid_v7();
+ALTER TABLE public.course_enrollments ALTER COLUMN id SET DEFAULT public.gen_uuid_v7();
+ALTER TABLE public.assignments ALTER COLUMN id SET DEFAULT public.gen_uuid_v7();
+ALTER TABLE public.assignment_submissions ALTER COLUMN id SET DEFAULT public.gen_uuid_v7();
+ALTER TABLE public.attendance ALTER COLUMN id SET DEFAULT public.gen_uuid_v7();
+ALTER TABLE public.announcements ALTER COLUMN id SET DEFAULT public.gen_uuid_v7();
@@ -0,0 +1,11 @@
+-- Index foreign key columns used in joins
+-- Postgres does not index the referencing side of a foreign key, so every
+-- RLS policy and embedded select joining on these columns scanned the table.
+-- Columns covered by a UNIQUE constraint with the same leading column
+-- (course_enrollments.course_id, assignment_submissions.assignment_id,
+-- attendance.course_id) already have a usable index and are skipped.
+CREATE INDEX IF NOT EXISTS idx_courses_teacher_id ON public.courses(teacher_id);
+CREATE INDEX IF NOT EXISTS idx_course_enrollments_student_id ON public.course_enrollments(student_id);
+CREATE INDEX IF NOT EXISTS idx_assignments_course_id ON public.assignments(course_id);
+CREATE INDEX IF NOT EXISTS idx_announcements_author_id ON public.announcements(author_id);
+CREATE INDEX IF NOT EXISTS idx_attendance_recorded_by ON public.attendance(recorded_by);
@@ -0,0 +1,36 @@
+-- Indexes for the hot read paths of attendance, submissions and announcements
+-- UNIQUE(course_id, student_id, date) cannot serve lookups by student alone nor
+-- date ranges, and UNIQUE(assignment_id, student_id) cannot serve a student's
+-- submission history.
+
+-- Attendance history of a student, newest first
+CREATE INDEX IF NOT EXISTS idx_attendance_student_date ON public.attendance(student_id, date DESC);
+
+-- Attendance of a course over a date range
+CREATE INDEX IF NOT EXISTS idx_attendance_course_date ON public.attendance(course_id, date DESC);
+
+-- Daily attendance reports across courses
+CREATE INDEX IF NOT EXISTS idx_attendance_date ON public.attendance(date);
+
+-- Submission history of a student, newest first
+CREATE INDEX IF NOT EXISTS idx_assignment_submissions_student_submitted
+  ON public.assignment_submissions(student_id, submitted_at DESC);
+
+-- Submissions pending grading
+CREATE INDEX IF NOT EXISTS idx_assignment_submissions_ungraded
+  ON public.assignment_submissions(assignment_id)
+  WHERE score IS NULL;
+
+-- Role filter for announcements
+-- GIN only serves array operators, so the policy is rewritten from
+-- role = ANY(target_roles) to the equivalent containment check.
+CREATE INDEX IF NOT EXISTS idx_announcements_target_roles
+  ON public.announcements USING GIN (target_roles);
+
+DROP POLICY IF EXISTS "Users can view published announcements" ON public.announcements;
+
+CREATE POLICY "Users can view published announcements" ON public.announcements
+  FOR SELECT USING (
+    is_published = true AND
+    target_roles @> ARRAY[public.get_current_user_role()]
+  );
@@ -0,0 +1,6 @@
+-- Add stored full_name column to profiles
+-- Computed once on write so lists and exports read a ready-made display name
+-- instead of concatenating first_name and last_name for every row.
+ALTER TABLE public.profiles
+  ADD COLUMN IF NOT EXISTS full_name TEXT
+  GENERATED ALWAYS AS (first_name || ' ' || last_name) STORED;
@@ -0,0 +1,33 @@
+-- Custom access token hook embedding the user's roles as a JWT claim
+-- Roles are resolved once when the token is issued or refreshed, so the
+-- client reads them from the session instead of querying user_roles on
+-- every auth event.
+CREATE OR REPLACE FUNCTION public.custom_access_token_hook(event JSONB)
+RETURNS JSONB AS $$
+DECLARE
+  claims JSONB;
+  roles JSONB;
+BEGIN
+  SELECT COALESCE(jsonb_agg(ur.role ORDER BY ur.created_at), '[]'::jsonb)
+  INTO roles
+  FROM public.user_roles ur
+  WHERE ur.user_id = (event->>'user_id')::uuid;
+
+  claims := jsonb_set(event->'claims', '{user_roles}', roles);
+  RETURN jsonb_set(event, '{claims}', claims);
+END;
+$$ LANGUAGE plpgsql STABLE SET search_path = public;
+
+-- Only the auth server may run the hook
+GRANT USAGE ON SCHEMA public TO supabase_auth_admin;
+GRANT EXECUTE ON FUNCTION public.custom_access_token_hook(JSONB) TO supabase_auth_admin;
+REVOKE EXECUTE ON FUNCTION public.custom_access_token_hook(JSONB) FROM authenticated, anon, public;
+
+GRANT SELECT ON public.user_roles TO supabase_auth_admin;
+
+DROP POLICY IF EXISTS "Auth admin can read user roles" ON public.user_roles;
+
+CREATE POLICY "Auth admin can read user roles" ON public.user_roles
+  AS PERMISSIVE FOR SELECT
+  TO supabase_auth_admin
+  USING (true);
@@ -0,0 +1,8 @@
+-- Index the profile columns used to resolve existing users
+-- The bulk student import looks profiles up by document_number, then
+-- student_code, then email when the auth user already exists.
+-- courses.code needs no extra index: its UNIQUE constraint already provides one.
+-- Migrations run inside a transaction, so CONCURRENTLY is not available here.
+CREATE INDEX IF NOT EXISTS idx_profiles_email ON public.profiles(email);
+CREATE INDEX IF NOT EXISTS idx_profiles_document_number ON public.profiles(document_number);
+CREATE INDEX IF NOT EXISTS idx_profiles_student_code ON public.profiles(student_code);
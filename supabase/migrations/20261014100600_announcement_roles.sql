@@ -0,0 +1,68 @@
+-- Normalize announcement target roles into a join table
+-- The policy role check becomes a B-tree lookup on (role, announcement_id)
+-- instead of an array scan. target_roles stays as the editable source and
+-- is mirrored into announcement_roles by a trigger.
+CREATE TABLE public.announcement_roles (
+  id UUID PRIMARY KEY DEFAULT public.gen_uuid_v7(),
+  announcement_id UUID REFERENCES public.announcements(id) ON DELETE CASCADE NOT NULL,
+  role user_role NOT NULL,
+  UNIQUE(announcement_id, role)
+);
+
+CREATE INDEX idx_announcement_roles_role ON public.announcement_roles(role, announcement_id);
+
+-- Backfill from existing arrays
+INSERT INTO public.announcement_roles (announcement_id, role)
+SELECT DISTINCT a.id, r.role
+FROM public.announcements a
+CROSS JOIN LATERAL unnest(a.target_roles) AS r(role)
+ON CONFLICT (announcement_id, role) DO NOTHING;
+
+-- Keep announcement_roles in sync with target_roles
+CREATE OR REPLACE FUNCTION public.sync_announcement_roles()
+RETURNS TRIGGER AS $$
+BEGIN
+  DELETE FROM public.announcement_roles
+  WHERE announcement_id = NEW.id
+    AND role <> ALL(COALESCE(NEW.target_roles, '{}'));
+
+  INSERT INTO public.announcement_roles (announcement_id, role)
+  SELECT DISTINCT NEW.id, r.role
+  FROM unnest(NEW.target_roles) AS r(role)
+  ON CONFLICT (announcement_id, role) DO NOTHING;
+
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER sync_announcement_roles
+  AFTER INSERT OR UPDATE OF target_roles ON public.announcements
+  FOR EACH ROW EXECUTE FUNCTION public.sync_announcement_roles();
+
+-- RLS Policies for announcement_roles table
+ALTER TABLE public.announcement_roles ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view their role's announcement targets" ON public.announcement_roles
+  FOR SELECT USING (role = public.get_current_user_role());
+
+CREATE POLICY "Admins and teachers can manage announcement targets" ON public.announcement_roles
+  FOR ALL USING (
+    public.has_role('admin'::user_role) OR 
+    public.has_role('teacher'::user_role)
+  );
+
+-- Filter announcements through the join table
+DROP POLICY IF EXISTS "Users can view published announcements" ON public.announcements;
+
+CREATE POLICY "Users can view published announcements" ON public.announcements
+  FOR SELECT USING (
+    is_published = true AND
+    EXISTS (
+      SELECT 1 FROM public.announcement_roles ar
+      WHERE ar.announcement_id = announcements.id
+        AND ar.role = public.get_current_user_role()
+    )
+  );
+
+-- The array index no longer backs any policy
+DROP INDEX IF EXISTS public.idx_announcements_target_roles;